@@ -17,6 +17,24 @@ from nomad.config.models.ui import (
 )
 
 SCHEMA='nomad_battery_database.schema_packages.battery_schema.ChemDataExtractorBattery'
+# Schema-qualified search quantities shared by columns, menus and widgets
+_Q = {
+    name: f'data.{name}#{SCHEMA}'
+    for name in (
+        'material_name',
+        'chemical_formula_hill',
+        'publication.journal',
+        'publication_year',
+        'available_properties',
+        'specifier',
+        'tag',
+        'capacity',
+        'voltage',
+        'coulombic_efficiency',
+        'energy_density',
+        'conductivity',
+    )
+}
 
 battery_app = AppEntryPoint(
     name='battery_app',
@@ -38,48 +56,48 @@ battery_app = AppEntryPoint(
         # ---------------------------- result table -------------------------
         columns=[
             Column(
-                quantity=f'data.material_name#{SCHEMA}',
+                quantity=_Q['material_name'],
                 label='Material',
                 selected=True,
             ),
             Column(
-                quantity=f'data.publication.journal#{SCHEMA}',
+                quantity=_Q['publication.journal'],
                 label='Journal',
                 selected=True,
             ),
             Column(
-                quantity=f'data.publication_year#{SCHEMA}',
+                quantity=_Q['publication_year'],
                 label='Publication Year',
             ),
             Column(
-                quantity=f'data.capacity#{SCHEMA}',
+                quantity=_Q['capacity'],
                 label='Capacity',
                 selected=True,
                 unit='mA*hour/g',
             ),
             Column(
-                quantity=f'data.voltage#{SCHEMA}',
+                quantity=_Q['voltage'],
                 label='Open-circuit voltage',
                 selected=True,
             ),
             Column(
-                quantity=f'data.coulombic_efficiency#{SCHEMA}',
+                quantity=_Q['coulombic_efficiency'],
                 label='Coulombic efficiency',
                 selected=True,
             ),
             Column(
-                quantity=f'data.energy_density#{SCHEMA}',
+                quantity=_Q['energy_density'],
                 label='Energy density',
                 selected=True,
                 unit='W*hour/kg',
             ),
             Column(
-                quantity=f'data.conductivity#{SCHEMA}',
+                quantity=_Q['conductivity'],
                 label='Conductivity',
                 selected=True,
             ),
             Column(
-                quantity=f'data.chemical_formula_hill#{SCHEMA}',
+                quantity=_Q['chemical_formula_hill'],
                 label='Formula (Hill)',
             ),
             Column(quantity='entry_id', label='Entry ID'),
@@ -90,30 +108,30 @@ battery_app = AppEntryPoint(
             title='Filters',
             items=[
                 MenuItemTerms(
-                    quantity=f'data.chemical_formula_hill#{SCHEMA}',
+                    quantity=_Q['chemical_formula_hill'],
                     title='Material',
                     show_input=True,
                 ),
                 MenuItemTerms(
-                    quantity=f'data.publication.journal#{SCHEMA}',
+                    quantity=_Q['publication.journal'],
                     title='Journal',
                     show_input=True,
                 ),
                 MenuItemTerms(
-                    quantity=f'data.publication_year#{SCHEMA}',
+                    quantity=_Q['publication_year'],
                     title='Publication Year',
                 ),
                 MenuItemTerms(
-                    quantity=f'data.available_properties#{SCHEMA}',
+                    quantity=_Q['available_properties'],
                     title='Available Properties',
                 ),
                 MenuItemTerms(
-                    quantity=f'data.specifier#{SCHEMA}',
+                    quantity=_Q['specifier'],
                     title='Specifier',
                     show_input=True,
                 ),
                 MenuItemTerms(
-                    quantity=f'data.tag#{SCHEMA}',
+                    quantity=_Q['tag'],
                     title='Tag',
                     show_input=True,
                 ),
@@ -134,7 +152,7 @@ battery_app = AppEntryPoint(
                 # --- histograms ---
                 WidgetHistogram(  # Capacity
                     title='Capacity distribution',
-                    x=AxisQuantity(search_quantity= f'data.capacity#{SCHEMA}',
+                    x=AxisQuantity(search_quantity=_Q['capacity'],
                                    unit='mA*hour/g'),
                     n_bins=100,
                     autorange=True,
@@ -145,7 +163,7 @@ battery_app = AppEntryPoint(
                 ),
                 WidgetHistogram(  # Voltage
                     title='Voltage distribution',
-                    x=f'data.voltage#{SCHEMA}',
+                    x=_Q['voltage'],
                     n_bins=100,
                     autorange=True,
                     layout={
@@ -155,7 +173,7 @@ battery_app = AppEntryPoint(
                 ),
                 WidgetHistogram(  # Coulombic Efficiency
                     title='Coulombic Efficiency distribution',
-                    x=f'data.coulombic_efficiency#{SCHEMA}',
+                    x=_Q['coulombic_efficiency'],
                     n_bins=100,
                     autorange=True,
                     layout={
@@ -165,7 +183,7 @@ battery_app = AppEntryPoint(
                 ),
                 WidgetHistogram( # Conductivity
                     title='Conductivity distribution',
-                    x=f'data.conductivity#{SCHEMA}',
+                    x=_Q['conductivity'],
                     n_bins=100,
                     autorange=True,
                     # scale='log',
@@ -176,7 +194,7 @@ battery_app = AppEntryPoint(
                 ),
                 WidgetHistogram(  # Energy density
                     title='Energy-density distribution',
-                    x=AxisQuantity(search_quantity= f'data.energy_density#{SCHEMA}',
+                    x=AxisQuantity(search_quantity=_Q['energy_density'],
                                    unit='W*hour/kg'),
                     n_bins=100,
                     autorange=True,
@@ -189,11 +207,11 @@ battery_app = AppEntryPoint(
                 WidgetScatterPlot(
                     title='Voltage vs Capacity (by Specifier)',
                     x=Axis(
-                        search_quantity=f'data.voltage#{SCHEMA}',
+                        search_quantity=_Q['voltage'],
                         title='Voltage',
                     ),
                     y=Axis(
-                        search_quantity=f'data.capacity#{SCHEMA}',
+                        search_quantity=_Q['capacity'],
                         title='Capacity',
                         unit='mA*hour/g',
                     ),
@@ -207,11 +225,11 @@ battery_app = AppEntryPoint(
                 WidgetScatterPlot(
                     title='Coulombic Efficiency vs Capacity',
                     x=Axis(
-                        search_quantity=f'data.coulombic_efficiency#{SCHEMA}',
+                        search_quantity=_Q['coulombic_efficiency'],
                         title='Coulombic Efficiency (%)',
                     ),
                     y=Axis(
-                        search_quantity=f'data.capacity#{SCHEMA}',
+                        search_quantity=_Q['capacity'],
                         title='Capacity',
                         unit='mA*hour/g',
                     ),
@@ -3,13 +3,13 @@ from nomad.config.models.plugins import ParserEntryPoint
 
 class BatteryDBParserEntryPoint(ParserEntryPoint):
 
-    def load(self): 
+    def load(self):
         from nomad_battery_database.parsers.battery_parser import BatteryParser
 
-        return BatteryParser(**self.dict())
+        return BatteryParser(**self.model_dump())
 
 
-battery_db_parser = BatteryDBParserEntryPoint(  
+battery_db_parser = BatteryDBParserEntryPoint(
     name='battery_parser',
     description="Parser for curated battery database CSV and YAML files.",
     mainfile_name_re=r'.*\.extracted_battery\.(csv|xlsx?)$',
@@ -1,26 +1,72 @@
 from __future__ import annotations
 
 import ast
+import csv
+import functools
+import math
 import re
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
 from typing import Any, Optional, Union
 
 import numpy as np
+import orjson
 import pandas as pd
 from nomad.datamodel import EntryArchive
+from nomad.metainfo import Quantity
 from nomad.parsing import MatchingParser
+from pandas.api.types import is_string_dtype
 
-from nomad_battery_database.parsers.utils import create_archive
+from nomad_battery_database.parsers.utils import (
+    child_archive_exists,
+    create_archive,
+)
 from nomad_battery_database.schema_packages.battery_schema import (
     ChemDataExtractorBattery,
 )
 
 COUNT_TOLERANCE: float = 1e-2
+CSV_CHUNK_SIZE: int = 10_000
+# bytes per record batch of the pyarrow reader (its default is 1 MiB)
+CSV_BLOCK_SIZE: int = 1 << 22
+
+# Quantity definitions rows are written through, resolved once at import
+_QUANTITIES = ChemDataExtractorBattery.m_def.all_quantities
+
+# First number in a messy cell such as '8.25 , 11.13 and 36.78' or '~150 mAh/g'
+_FIRST_FLOAT_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+# Text JSON would read differently from a Python literal (true/false/null,
+# integers beyond 64 bits) or that may hold a quote inside a string (double
+# quotes, backslash escapes); such cells skip the JSON path
+_JSON_ONLY_RE = re.compile(r'true|false|null|["\\]|\d{19}')
+
+# Element counts float() reads exactly like their str()
+_PLAIN_COUNT_TYPES = (str, int, float)
+
+# How the cells of a column are converted before assignment
+_LITERAL_COLUMN = 'literal'
+_NUMBER_COLUMN = 'number'
+_TEXT_COLUMN = 'text'
+
+
+def _literal_eval(text: str) -> Any:
+    """
+    ``ast.literal_eval`` for the single-quoted list/dict cells. Without double
+    quotes or escapes every single quote delimits a string, so such cells are
+    decoded as JSON with the quotes swapped.
+    """
+    if not _JSON_ONLY_RE.search(text):
+        try:
+            return orjson.loads(text.replace("'", '"'))
+        except orjson.JSONDecodeError:
+            pass
+    return ast.literal_eval(text)
 
 
 def _safe_literal_eval(raw: str) -> Optional[list[dict[str, Any]]]:
     try:
-        evaluated = ast.literal_eval(raw)
+        evaluated = _literal_eval(raw)
         if isinstance(evaluated, list):
             return evaluated
     except (ValueError, SyntaxError, TypeError):
@@ -42,33 +88,35 @@ def _normalize_parts(
 
 def _merge_element_counts(parts: list[dict[str, Any]]) -> Optional[dict[str, float]]:
     totals: dict[str, float] = {}
+    get = totals.get
     for part in parts:
         for elem, cnt in part.items():
             try:
-                n = float(str(cnt))
+                # str() only for other types, so that e.g. True stays invalid
+                n = float(cnt if type(cnt) in _PLAIN_COUNT_TYPES else str(cnt))
             except Exception:
                 # simply skip unparseable counts such as 'x-3'
                 continue
-            totals[elem] = totals.get(elem, 0.0) + n
+            totals[elem] = get(elem, 0.0) + n
     return totals or None
 
 
+def _format_count(el: str, n: float) -> str:
+    if abs(n - 1.0) < COUNT_TOLERANCE:
+        return el
+    return f'{el}{int(n) if n.is_integer() else n}'
+
+
 def _format_formula(totals: dict[str, float]) -> Optional[str]:
-    elems = []
+    formula = []
     if 'C' in totals:
-        elems.append('C')
+        formula.append(_format_count('C', totals['C']))
         if 'H' in totals:
-            elems.append('H')
-    elems += [e for e in sorted(totals) if e not in {'C', 'H'}]
-
-    formula = ''
-    for el in elems:
-        n = totals[el]
-        if abs(n - 1.0) < COUNT_TOLERANCE:
-            formula += el
-        else:
-            formula += f'{el}{int(n) if n.is_integer() else n}'
-    return formula or None
+            formula.append(_format_count('H', totals['H']))
+    formula += [
+        _format_count(el, n) for el, n in sorted(totals.items()) if el not in {'C', 'H'}
+    ]
+    return ''.join(formula) or None
 
 
 def _hill_from_extracted(raw: Optional[Union[str, list]]) -> Optional[str]:
@@ -78,13 +126,168 @@ def _hill_from_extracted(raw: Optional[Union[str, list]]) -> Optional[str]:
     parts = _normalize_parts(raw)
     if not parts:
         return None
-    totals = _merge_element_counts(parts)
+    # The same composition recurs across many rows, so cache on its items; the
+    # count's type is part of the key so that e.g. True and 1 stay distinct
+    key = tuple(
+        tuple((el, type(cnt), cnt) for el, cnt in part.items()) for part in parts
+    )
+    try:
+        hash(key)
+    except TypeError:  # unhashable counts cannot be cached
+        return _hill_from_parts.__wrapped__(key)
+    return _hill_from_parts(key)
+
+
+@functools.lru_cache(maxsize=4096)
+def _hill_from_parts(
+    parts: tuple[tuple[tuple[str, type, Any], ...], ...],
+) -> Optional[str]:
+    totals = _merge_element_counts(
+        [{el: cnt for el, _, cnt in part} for part in parts]
+    )
     if totals is None:
         return None
 
     return _format_formula(totals)
 
 
+def _extract_first_float(cells: pd.Series) -> pd.Series:
+    """First number of each messy text cell, NaN where there is none."""
+    matches = cells.astype('string').str.extract(
+        f'({_FIRST_FLOAT_RE.pattern})', expand=False
+    )
+    return pd.to_numeric(matches, errors='coerce').astype('float64')
+
+
+def _is_missing(value: Any) -> bool:
+    """Scalar missing-value test that, unlike ``pd.isna``, accepts list cells."""
+    return (
+        value is None
+        or value is pd.NA
+        or value is pd.NaT
+        or (isinstance(value, float) and math.isnan(value))
+    )
+
+
+def _parse_literal(value: Any) -> Any:
+    """
+    Evaluate a Python-literal cell such as ``Extracted_name`` or ``Info``; a
+    single mapping is wrapped in a list and unparseable text is kept as is.
+    Cells that are not text (e.g. from Excel) are returned unchanged.
+    """
+    if not isinstance(value, str):
+        return value
+    return _parse_literal_text(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_literal_text(value: str) -> Any:
+    # Cached so that cells repeated across batches are evaluated only once; only
+    # strings get here, as the cache would treat e.g. True and 1.0 as one key
+    try:
+        parsed_value = _literal_eval(value)
+    except (ValueError, SyntaxError):
+        return value
+    if isinstance(parsed_value, dict):
+        parsed_value = [parsed_value]
+    return parsed_value
+
+
+def _last_position(columns: list[tuple[Quantity, str]], attr: str) -> Optional[int]:
+    """Position of the column that ends up setting *attr* (the last one wins)."""
+    positions = [pos for pos, (q, _) in enumerate(columns) if q.name == attr]
+    return positions[-1] if positions else None
+
+
+def _entry_file_name(material_name: Any, row_index: int) -> str:
+    """
+    Child archive file name for a row, from its raw ``Name`` cell (stripped the
+    same way as ``material_name``) or, failing that, its row index.
+    """
+    name = '' if _is_missing(material_name) else str(material_name).strip()
+    entry_name = (name or f'row_{row_index}').replace(' ', '_').replace('/', '_')
+    return f'{entry_name}.battery.archive.json'
+
+
+def _iter_csv(path: Path) -> Iterator[pd.DataFrame]:
+    """
+    Yield a curated CSV as a sequence of DataFrames with every column as text, so
+    peak memory is bounded by one chunk rather than the whole file. Each cell is
+    converted by the row loop anyway, so dtype inference is skipped, and columns
+    without a counterpart quantity are not read at all; the streaming
+    ``pyarrow`` reader is used when it is installed.
+    """
+    with open(path, newline='', encoding='utf-8-sig') as fh:
+        header = next(csv.reader(fh), [])
+    used = [header[pos] for pos, _, _ in _column_attributes(header)]
+
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        yield from _iter_csv_pandas(path, used)
+        return
+
+    convert_options = pa_csv.ConvertOptions(
+        column_types=dict.fromkeys(used, pa.string()),
+        # in file order, so that the last of two aliased columns still wins
+        include_columns=used,
+        # same missing-value markers as pd.read_csv
+        null_values=[*pa_csv.ConvertOptions().null_values, 'None', '<NA>'],
+        strings_can_be_null=True,
+    )
+    done = 0
+    try:
+        with pa.memory_map(str(path)) as source:
+            reader = pa_csv.open_csv(
+                source,
+                read_options=pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=convert_options,
+            )
+            for batch in reader:
+                done += batch.num_rows
+                yield batch.to_pandas(split_blocks=True, self_destruct=True)
+    except pa.ArrowInvalid:
+        # pyarrow rejects rows with missing trailing fields, which pandas pads
+        # with NaN; continue with pandas after the rows already yielded
+        for df in _iter_csv_pandas(path, used):
+            if done >= len(df):
+                done -= len(df)
+                continue
+            yield df.iloc[done:]
+            done = 0
+
+
+def _iter_csv_pandas(path: Path, used: list[str]) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(
+        path,
+        dtype=str,
+        usecols=set(used) or None,
+        chunksize=CSV_CHUNK_SIZE,
+        memory_map=True,
+    ) as reader:
+        yield from reader
+
+
+def _read_excel(path: Path) -> pd.DataFrame:
+    """
+    Read the columns of a spreadsheet that map onto a quantity, with the Rust
+    ``calamine`` engine when it is installed and pandas supports it (2.2+).
+    """
+    engine = None
+    if tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2):
+        try:
+            import python_calamine  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            engine = 'calamine'
+    return pd.read_excel(
+        path, engine=engine, usecols=lambda col: bool(_column_attributes([col]))
+    )
+
+
 class BatteryParser(MatchingParser):
     """Parse CSV or YAML files from the curated battery database."""
 
@@ -104,92 +307,121 @@ class BatteryParser(MatchingParser):
     def _parse_table(self, path: Path, archive: EntryArchive, logger=None) -> None:
         ext = path.suffix.lower()
         if ext in {'.xls', '.xlsx'}:
-            df = pd.read_excel(path).replace(np.nan, None)
+            chunks = [_read_excel(path)]
         else:  # falls back to CSV
-            df = pd.read_csv(path).replace(np.nan, None)
+            chunks = _iter_csv(path)
+
+        offset = 0
+        header = None
+        for df in chunks:
+            # Resolve the header once per file instead of once per cell; all
+            # chunks of a file share it
+            if header is None:
+                header = _column_attributes(df.columns)
+            offset += self._parse_chunk(df, header, archive, offset, logger)
+
+    def _parse_chunk(
+        self,
+        df: pd.DataFrame,
+        header: list[tuple[int, Quantity, str]],
+        archive: EntryArchive,
+        offset: int,
+        logger=None,
+    ) -> int:
+        """Create one child archive per row of *df*; returns the row count."""
+        # Keep only the mapped columns so each row tuple carries just the used
+        # cells
+        df = df.iloc[:, [pos for pos, _, _ in header]]
+        columns = [(quantity, kind) for _, quantity, kind in header]
+        name_pos = _last_position(columns, 'material_name')
+        self._convert_columns(df, columns)
+        skipped = 0
+        rows = df.itertuples(index=False, name=None)
+        for idx, row in enumerate(rows, start=offset):
+            name = None if name_pos is None else row[name_pos]
+            file_name = _entry_file_name(name, idx)
+            # Child archives are never overwritten, so on reprocessing the rows
+            # that already have one need not be converted again
+            if child_archive_exists(archive, file_name):
+                skipped += 1
+                continue
 
-        for idx, row in df.iterrows():
             db = ChemDataExtractorBattery()
-            self._populate_entry_from_row(db, row)
-
-            # Create a child archive file
-            entry_name = (
-                (db.material_name or f'row_{idx}').replace(' ', '_').replace('/', '_')
-            )
-            file_name = f'{entry_name}.battery.archive.json'
-
-            create_archive(db, archive, file_name)
-            logger and logger.info('archive_created', file=file_name, row_index=idx)
-
-    def _safe_float(self, value: object) -> Optional[float]:
-        """Return *first* float found in a messy numeric cell."""
-        if value is None or (isinstance(value, float) and pd.isna(value)):
-            return None
-
-        if isinstance(value, (int, float)):
-            return float(value)
+            self._populate_entry_from_row(db, row, columns)
+            create_archive(db, archive, file_name, check_exists=False)
+
+        logger and logger.info(
+            'archives_created',
+            count=len(df) - skipped,
+            skipped_existing=skipped,
+            first_row_index=offset,
+        )
+        return len(df)
 
-        text = str(value)
-        text = text.replace(';', ',').replace(' and ', ',')
-        tokens = re.split(r'[^0-9eE+\-.]+', text)
-        for tok in tokens:
-            if tok in {'', '+', '-', '.'}:
-                continue
-            try:
-                return float(tok)
-            except ValueError:
-                continue
-        return None
+    def _convert_columns(
+        self, df: pd.DataFrame, columns: list[tuple[Quantity, str]]
+    ) -> None:
+        """
+        Convert numeric and literal columns in bulk before the row loop.
+
+        Numeric cells go through ``pd.to_numeric``; only the cells it cannot read
+        as a finite number (ranges, lists, unit suffixes, ...) go through the
+        first-number regex of :func:`_extract_first_float`. Literal cells repeat
+        heavily (the same material in many papers), so each distinct string is
+        evaluated once. Units and every other column become stripped strings.
+        """
+        for pos, (_, kind) in enumerate(columns):
+            raw = df.iloc[:, pos]
+            if kind == _NUMBER_COLUMN:
+                num = pd.to_numeric(raw, errors='coerce').astype('float64')
+                messy = ~np.isfinite(num) & raw.notna()
+                if messy.any():
+                    num[messy] = _extract_first_float(raw[messy])
+                df.isetitem(pos, num)
+            elif kind == _LITERAL_COLUMN:
+                codes, uniques = pd.factorize(raw)
+                # code -1 marks a missing cell and picks the trailing None
+                parsed = [_parse_literal(value) for value in uniques] + [None]
+                df.isetitem(
+                    pos, pd.Series([parsed[c] for c in codes], index=df.index)
+                )
+            else:
+                # Excel cells keep their own type, CSV cells are text already
+                if not is_string_dtype(raw):
+                    raw = raw.map(str, na_action='ignore')
+                df.isetitem(pos, raw.astype('string').str.strip())
 
     def _populate_general_attributes(
-        self, db: ChemDataExtractorBattery, row: pd.Series
+        self,
+        db: ChemDataExtractorBattery,
+        row: Sequence[Any],
+        columns: list[tuple[Quantity, str]],
     ) -> None:
-        for col, value in row.items():
-            if pd.isna(value):
-                continue
-
-            key = col.strip().lower().replace(' ', '_')
-            attr = _col_to_attr(key)
-
-            if not hasattr(db, attr):
-                continue
-
-            if key in {'extracted_name', 'info'}:
-                if isinstance(value, str):
-                    try:
-                        parsed_value = ast.literal_eval(value)
-                        if isinstance(parsed_value, dict):
-                            parsed_value = [parsed_value]
-                        setattr(db, attr, parsed_value)
-                    except (ValueError, SyntaxError):
-                        setattr(db, attr, value)
-                else:
-                    setattr(db, attr, value)
-                continue
-
-            if key.endswith(('_value', '_raw_value')):
-                num = self._safe_float(value)
-                if num is not None:
-                    setattr(db, attr, num)
-                continue
-
-            if key.endswith(('_unit', '_raw_unit')):
-                setattr(db, attr, str(value).strip())
+        # m_set with the resolved definition skips the by-name lookup of setattr
+        for (quantity, kind), value in zip(columns, row):
+            if _is_missing(value):
                 continue
 
-            # Default case: treat as a string
-            setattr(db, attr, str(value).strip())
+            if kind == _NUMBER_COLUMN:
+                # already float64, see _convert_columns
+                db.m_set(quantity, float(value))
+            else:
+                # already evaluated or stripped, see _convert_columns
+                db.m_set(quantity, value)
 
     def _populate_derived_attributes(self, db: ChemDataExtractorBattery) -> None:
         if db.extracted_name and not db.chemical_formula_hill:
             hill = _hill_from_extracted(db.extracted_name)
             if hill:
-                db.chemical_formula_hill = hill
+                db.m_set(_QUANTITIES['chemical_formula_hill'], hill)
 
     def _populate_entry_from_row(
-        self, db: ChemDataExtractorBattery, row: pd.Series
+        self,
+        db: ChemDataExtractorBattery,
+        row: Sequence[Any],
+        columns: list[tuple[Quantity, str]],
     ) -> None:
-        self._populate_general_attributes(db, row)
+        self._populate_general_attributes(db, row, columns)
         self._populate_derived_attributes(db)
 
     def does_match(self, mainfile: str, mainfile_content: bytes, logger):
@@ -198,9 +430,10 @@ class BatteryParser(MatchingParser):
         )
         if mainfile.endswith('.csv'):
             try:
-                content_str = mainfile_content.decode('utf-8', errors='ignore')
-                first_line = content_str.splitlines()[0]
-                if 'Name,' in first_line and 'Capacity_Raw_value,' in first_line:
+                # the header is ASCII, so the raw bytes are searched undecoded
+                end = mainfile_content.find(b'\n')
+                first_line = mainfile_content[:end] if end >= 0 else mainfile_content
+                if b'Name,' in first_line and b'Capacity_Raw_value,' in first_line:
                     logger.info('BatteryParser.does_match confirmed for CSV.')
                     return True
                 else:
@@ -242,4 +475,29 @@ def _col_to_attr(column_key: str) -> str:
     Keeps the previous *lower-case/underscore* rule but honours explicit
     aliases first.
     """
-    return _ALIASES.get(column_key, column_key)
\ No newline at end of file
+    return _ALIASES.get(column_key, column_key)
+
+
+def _column_kind(column_key: str) -> str:
+    """Decide once per column how its cells are converted."""
+    if column_key in {'extracted_name', 'info'}:
+        return _LITERAL_COLUMN
+    if column_key.endswith(('_value', '_raw_value')):
+        return _NUMBER_COLUMN
+    return _TEXT_COLUMN
+
+
+def _column_attributes(
+    columns: Iterable[str],
+) -> list[tuple[int, Quantity, str]]:
+    """
+    Resolve a table header to ``(position, quantity, kind)`` triples, dropping
+    columns that have no quantity on :class:`ChemDataExtractorBattery`.
+    """
+    resolved = []
+    for pos, col in enumerate(columns):
+        key = str(col).strip().lower().replace(' ', '_')
+        quantity = _QUANTITIES.get(_col_to_attr(key))
+        if quantity is not None:
+            resolved.append((pos, quantity, _column_kind(key)))
+    return resolved
\ No newline at end of file
@@ -1,6 +1,6 @@
-import json
 from typing import Optional
 
+import orjson
 from nomad.datamodel.context import ClientContext
 from nomad.utils import hash as _hash
 
@@ -13,20 +13,44 @@ def get_entry_id_from_file_name(file_name: str, archive) -> str:
     return _hash(archive.metadata.upload_id, file_name)
 
 
-def create_archive(section, parent_archive, file_name: str) -> Optional[str]:
+def child_archive_exists(parent_archive, file_name: str) -> bool:
+    """
+    Tell whether ``file_name`` was already written to the upload, e.g. by an
+    earlier processing run of the same mainfile.
+    """
+    context = parent_archive.m_context
+    if context is None or isinstance(context, ClientContext):
+        return False
+    return context.raw_path_exists(file_name)
+
+
+def _write_json(context, file_name: str, data: dict) -> None:
+    # non-string keys, e.g. in JSON quantities, are written as strings
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    with context.raw_file(file_name, 'wb') as fp:
+        fp.write(orjson.dumps(data, option=option))
+
+
+def create_archive(
+    section, parent_archive, file_name: str, check_exists: bool = True
+) -> Optional[str]:
     """
     Write *section* to ``file_name`` inside the current upload and register it
     as a **child archive**.  Returns a reference string that can be stored in
-    relationships if you need it later.
+    relationships if you need it later.  Pass ``check_exists=False`` when the
+    caller has already made sure the file does not exist.
     """
     # Uploads created via the REST client do not expose a raw-file context
     if isinstance(parent_archive.m_context, ClientContext):
         return None
 
     # Only write once (idempotent re-upload)
-    if not parent_archive.m_context.raw_path_exists(file_name):
-        with parent_archive.m_context.raw_file(file_name, 'w') as fp:
-            json.dump({'data': section.m_to_dict(with_root_def=True)}, fp)
+    if not check_exists or not parent_archive.m_context.raw_path_exists(file_name):
+        _write_json(
+            parent_archive.m_context,
+            file_name,
+            {'data': section.m_to_dict(with_root_def=True)},
+        )
 
         # Tell NOMAD the file was added so it gets parsed immediately
         parent_archive.m_context.process_updated_raw_file(file_name)
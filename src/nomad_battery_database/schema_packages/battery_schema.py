@@ -21,6 +21,19 @@ if TYPE_CHECKING:
 
 m_package = SchemaPackage()
 
+# Normalized quantitative properties and their display names
+_PROPERTY_DISPLAY_NAMES = {
+    'capacity': 'Capacity',
+    'voltage': 'Voltage',
+    'coulombic_efficiency': 'Coulombic Efficiency',
+    'energy_density': 'Energy Density',
+    'conductivity': 'Conductivity',
+}
+# Raw extracted value quantity paired with the normalized quantity it fills
+_RAW_VALUE_QUANTITIES = tuple(
+    (f'{prop_name}_raw_value', prop_name) for prop_name in _PROPERTY_DISPLAY_NAMES
+)
+
 def _process_composition(
     raw: Union[str, list, None],
 ) -> Union[list[dict[str, Union[float, str]]], None]:
@@ -221,6 +234,13 @@ def populate_battery_sample_info(sample: 'Battery',  # noqa: PLR0912, PLR0915
 
         archive.results.elemental_composition = sample.elemental_composition
 
+def _is_blank(value: Union[str, None]) -> bool:
+    """
+    Returns True for None, empty and whitespace-only strings.
+    """
+    return not value or value.isspace()
+
+
 def sanitize_string(input_str: Union[str, None]) -> Union[str, None]:
     """
     Replaces various Unicode dash and minus characters with a standard hyphen.
@@ -331,16 +351,9 @@ class Battery(CompositeSystem, EntryData):
     )
 
     def _set_available_properties(self) -> None:
-        property_map = {
-            'capacity': 'Capacity',
-            'voltage': 'Voltage',
-            'coulombic_efficiency': 'Coulombic Efficiency',
-            'energy_density': 'Energy Density',
-            'conductivity': 'Conductivity',
-        }
         present_properties = [
             display_name
-            for prop_name, display_name in property_map.items()
+            for prop_name, display_name in _PROPERTY_DISPLAY_NAMES.items()
             if getattr(self, prop_name) is not None
         ]
 
@@ -473,26 +486,20 @@ class ChemDataExtractorBattery(Battery):
     def _normalize_publication(
         self, archive: 'EntryArchive', logger: 'BoundLogger'
     ) -> None:
-        if self.doi and not self.publication:
-            logger.info(f'Creating Publication Reference section for DOI: {self.doi}')
+        if not _is_blank(self.doi) and not self.publication:
             pub = PublicationReference(DOI_number=self.doi)
             self.publication = pub
+            logger.info('publication_reference_created', doi=self.doi)
             self.publication.normalize(archive, logger)
         if self.publication and self.publication.publication_date:
             self.publication_year = str(self.publication.publication_date.year)
 
     def _normalize_quantitative_properties(self) -> None:
-        for raw, clean in [
-            ('capacity_raw_value', 'capacity'),
-            ('voltage_raw_value', 'voltage'),
-            ('coulombic_efficiency_raw_value', 'coulombic_efficiency'),
-            ('energy_density_raw_value', 'energy_density'),
-            ('conductivity_raw_value', 'conductivity'),
-        ]:
+        for raw, clean in _RAW_VALUE_QUANTITIES:
             if getattr(self, clean, None) is not None:
                 continue
             raw_val_str = getattr(self, raw, None)
-            if raw_val_str:
+            if not _is_blank(raw_val_str):
                 try:
                     num = float(raw_val_str)
                     if not np.isnan(num):
@@ -501,9 +508,11 @@ class ChemDataExtractorBattery(Battery):
                     pass
 
     def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
-        if self.material_name:
-            logger.info(f"Sanitizing material_name: '{self.material_name}'")
-            self.material_name = sanitize_string(self.material_name)
+        if not _is_blank(self.material_name):
+            sanitized = sanitize_string(self.material_name)
+            if sanitized != self.material_name:
+                logger.info('material_name_sanitized', material_name=sanitized)
+                self.material_name = sanitized
         super().normalize(archive, logger)
         self._normalize_quantitative_properties()
         populate_battery_sample_info(self, archive, logger)
@@ -0,0 +1,127 @@
+import ast
+import os
+import sys
+
+import pandas as pd
+import pytest
+from nomad.datamodel import EntryArchive
+from nomad.utils import get_logger
+
+from nomad_battery_database.parsers import battery_db_parser
+from nomad_battery_database.parsers.battery_parser import (
+    _extract_first_float,
+    _hill_from_extracted,
+    _hill_from_parts,
+    _iter_csv,
+    _literal_eval,
+    _parse_literal,
+)
+
+CSV_FILE = os.path.join('tests', 'data', 'battery_data_pivot.extracted_battery.csv')
+CREATE_ARCHIVE_TARGET = 'nomad_battery_database.parsers.battery_parser.create_archive'
+EXISTS_TARGET = 'nomad_battery_database.parsers.battery_parser.child_archive_exists'
+PARSER_MODULE = 'nomad_battery_database.parsers.battery_parser'
+EXPECTED_ARCHIVE_COUNT = 85
+
+
+def _parse_file_names(monkeypatch, mainfile=CSV_FILE):
+    file_names = []
+    monkeypatch.setattr(
+        CREATE_ARCHIVE_TARGET,
+        lambda db, parent_archive, file_name, **kwargs: file_names.append(file_name),
+    )
+    parser = battery_db_parser.load()
+    parser.parse(mainfile, EntryArchive(), get_logger(__name__))
+    return file_names
+
+
+def test_existing_child_archives_are_skipped(monkeypatch):
+    all_file_names = _parse_file_names(monkeypatch)
+    assert len(all_file_names) == EXPECTED_ARCHIVE_COUNT
+
+    existing = set(all_file_names[:10])
+    monkeypatch.setattr(EXISTS_TARGET, lambda parent, file_name: file_name in existing)
+    file_names = _parse_file_names(monkeypatch)
+
+    assert file_names == [name for name in all_file_names if name not in existing]
+
+
+def test_rows_missing_trailing_fields_are_parsed(monkeypatch, tmp_path):
+    mainfile = tmp_path / 'short.extracted_battery.csv'
+    mainfile.write_text(
+        'Name,Capacity_Raw_value,Voltage_Raw_value,Extracted_name\n'
+        'LiCoO2,140,3.9,"[{\'Li\': \'1\', \'Co\': \'1\', \'O\': \'2\'}]"\n'
+        'LiFePO4,170\n'
+        'LiMn2O4,120,4.0,\n'
+    )
+    file_names = _parse_file_names(monkeypatch, str(mainfile))
+
+    assert file_names == [
+        f'{name}.battery.archive.json' for name in ('LiCoO2', 'LiFePO4', 'LiMn2O4')
+    ]
+
+
+@pytest.mark.parametrize('with_pyarrow', [True, False])
+def test_row_names_keep_counting_across_batches(monkeypatch, tmp_path, with_pyarrow):
+    if not with_pyarrow:
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    monkeypatch.setattr(f'{PARSER_MODULE}.CSV_CHUNK_SIZE', 3)
+    monkeypatch.setattr(f'{PARSER_MODULE}.CSV_BLOCK_SIZE', 32)
+    mainfile = tmp_path / 'unnamed.extracted_battery.csv'
+    mainfile.write_text(
+        'Name,Capacity_Raw_value\n' + ''.join(f',{i}\n' for i in range(10))
+    )
+    assert len(list(_iter_csv(mainfile))) > 1
+
+    file_names = _parse_file_names(monkeypatch, str(mainfile))
+
+    assert file_names == [f'row_{i}.battery.archive.json' for i in range(10)]
+
+
+@pytest.mark.parametrize(
+    'cell, expected',
+    [
+        ('217', 217.0),
+        ('8.25 , 11.13 , 18.46 and 36.78', 8.25),
+        ('~ 150 mAh/g', 150.0),
+        ('-0.5; 1.2', -0.5),
+        ('1.5e-3 S/cm', 1.5e-3),
+        ('.5', 0.5),
+        ('no value', None),
+    ],
+)
+def test_first_float_of_messy_cell(cell, expected):
+    extracted = _extract_first_float(pd.Series([cell])).iloc[0]
+    assert (extracted if not pd.isna(extracted) else None) == expected
+
+
+@pytest.mark.parametrize(
+    'cell',
+    [
+        "[{'Cu': '1.0', 'O': '1.0'}, {'C': '1.0'}]",
+        "{'cycle_value': '50', 'cycle_units': 'cycles'}",
+        "[{'Li': 1, 'O': 2.5}]",
+        "[\"it's\"]",
+        "['\\u00e9']",
+        "[{'a': None, 'b': True}]",
+        "[{'Li': '1', 'note': 'a\", \"O\": \"2'}]",
+        "[12345678901234567890123]",
+    ],
+)
+def test_literal_cells_read_like_python(cell):
+    assert _literal_eval(cell) == ast.literal_eval(cell)
+
+
+@pytest.mark.parametrize('bool_first', [True, False])
+def test_hill_cache_keeps_bool_counts_apart(bool_first):
+    _hill_from_parts.cache_clear()
+    compositions = [([{'Li': True, 'O': 2}], 'O2'), ([{'Li': 1, 'O': 2}], 'LiO2')]
+    if not bool_first:
+        compositions.reverse()
+    for parts, expected in compositions:
+        assert _hill_from_extracted(parts) == expected
+
+
+def test_literal_cache_keeps_non_text_cells_apart():
+    assert _parse_literal(True) is True
+    assert type(_parse_literal(1.0)) is float
@@ -24,7 +24,7 @@ def test_full_parsing_and_normalization_pipeline(monkeypatch):
         'Ensure the path is correct relative to where you run pytest.'
     )
     captured_archives = []
-    def mock_create_archive(db_section, parent_archive, file_name):
+    def mock_create_archive(db_section, parent_archive, file_name, **kwargs):
         metadata = EntryMetadata(entry_name=file_name)
         new_archive = EntryArchive(data=db_section, metadata=metadata)
         captured_archives.append(new_archive)